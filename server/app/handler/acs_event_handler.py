@@ -16,6 +16,13 @@ from quart import Response
 
 logger = logging.getLogger(__name__)
 
+MEDIA_STREAMING_UPDATE_EVENTS = frozenset(
+    {
+        "Microsoft.Communication.MediaStreamingStarted",
+        "Microsoft.Communication.MediaStreamingStopped",
+    }
+)
+
 
 class AcsEventHandler:
     """Handles ACS event processing and call answering logic."""
@@ -127,20 +134,7 @@ class AcsEventHandler:
                 logger.info("CORRELATION ID:--> %s", event_data["correlationId"])
                 logger.info("CALL CONNECTION ID:--> %s", call_connection_id)
 
-            elif event["type"] == "Microsoft.Communication.MediaStreamingStarted":
-                update = event_data["mediaStreamingUpdate"]
-                logger.info(
-                    "Media streaming content type:--> %s", update["contentType"]
-                )
-                logger.info(
-                    "Media streaming status:--> %s", update["mediaStreamingStatus"]
-                )
-                logger.info(
-                    "Media streaming status details:--> %s",
-                    update["mediaStreamingStatusDetails"],
-                )
-
-            elif event["type"] == "Microsoft.Communication.MediaStreamingStopped":
+            elif event["type"] in MEDIA_STREAMING_UPDATE_EVENTS:
                 update = event_data["mediaStreamingUpdate"]
                 logger.info(
                     "Media streaming content type:--> %s", update["contentType"]
@@ -12,6 +12,21 @@ from websockets.typing import Data
 
 logger = logging.getLogger(__name__)
 
+STOP_AUDIO_MESSAGE = json.dumps(
+    {"Kind": "StopAudio", "AudioData": None, "StopAudio": {}}
+)
+
+_credentials = {}
+
+
+def _managed_identity_credential(client_id):
+    """Returns a cached ManagedIdentityCredential so its token cache is reused."""
+    credential = _credentials.get(client_id)
+    if credential is None:
+        credential = ManagedIdentityCredential(managed_identity_client_id=client_id)
+        _credentials[client_id] = credential
+    return credential
+
 
 def session_config():
     """Returns the default session configuration for Voice Live."""
@@ -53,6 +68,7 @@ class ACSMediaHandler:
         self.send_queue = asyncio.Queue()
         self.ws = None
         self.send_task = None
+        self.receive_task = None
         self.incoming_websocket = None
         self.is_raw_audio = True
 
@@ -67,9 +83,7 @@ class ACSMediaHandler:
         headers = {"x-ms-client-request-id": self._generate_guid()}
 
         if self.client_id:
-            credential = ManagedIdentityCredential(
-                managed_identity_client_id=self.client_id
-            )
+            credential = _managed_identity_credential(self.client_id)
             token = await credential.get_token(
                 "https://cognitiveservices.azure.com/.default"
             )
@@ -83,9 +97,18 @@ class ACSMediaHandler:
         await self._send_json(session_config())
         await self._send_json({"type": "response.create"})
 
-        asyncio.create_task(self._receiver_loop())
+        self.receive_task = asyncio.create_task(self._receiver_loop())
         self.send_task = asyncio.create_task(self._sender_loop())
 
+    async def close(self):
+        """Stops the sender/receiver loops and closes the Voice Live WebSocket."""
+        for task in (self.send_task, self.receive_task):
+            if task:
+                task.cancel()
+        if self.ws:
+            await self.ws.close()
+            self.ws = None
+
     async def init_incoming_websocket(self, socket, is_raw_audio=True):
         """Sets up incoming ACS WebSocket."""
         self.incoming_websocket = socket
@@ -200,8 +223,7 @@ class ACSMediaHandler:
 
     async def stop_audio(self):
         """Sends a StopAudio signal to ACS."""
-        stop_audio_data = {"Kind": "StopAudio", "AudioData": None, "StopAudio": {}}
-        await self.send_message(json.dumps(stop_audio_data))
+        await self.send_message(STOP_AUDIO_MESSAGE)
 
     async def acs_to_voicelive(self, stream_data):
         """Processes audio from ACS and forwards to Voice Live if not silent."""
@@ -48,13 +48,16 @@ async def acs_ws():
     logger.info("Incoming ACS WebSocket connection")
     handler = ACSMediaHandler(app.config)
     await handler.init_incoming_websocket(websocket, is_raw_audio=False)
-    asyncio.create_task(handler.connect())
+    connect_task = asyncio.create_task(handler.connect())
     try:
         while True:
             msg = await websocket.receive()
             await handler.acs_to_voicelive(msg)
     except Exception:
         logger.exception("ACS WebSocket connection closed")
+    finally:
+        connect_task.cancel()
+        await handler.close()
 
 
 @app.websocket("/web/ws")
@@ -64,13 +67,16 @@ async def web_ws():
     logger.info("Incoming Web WebSocket connection")
     handler = ACSMediaHandler(app.config)
     await handler.init_incoming_websocket(websocket, is_raw_audio=True)
-    asyncio.create_task(handler.connect())
+    connect_task = asyncio.create_task(handler.connect())
     try:
         while True:
             msg = await websocket.receive()
             await handler.web_to_voicelive(msg)
     except Exception:
         logger.exception("Web WebSocket connection closed")
+    finally:
+        connect_task.cancel()
+        await handler.close()
 
 
 @app.route("/")
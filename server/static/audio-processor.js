@@ -1,28 +1,57 @@
 class RingBufferProcessor extends AudioWorkletProcessor {
   constructor() {
     super();
-    this.buffer = new Float32Array(0);
+    // Ten seconds at 24 kHz; grows only if the agent outpaces playback.
+    this.buffer = new Float32Array(24000 * 10);
+    this.readIndex = 0;
+    this.available = 0;
     this.port.onmessage = e => {
       if (e.data.pcm) {
-        const next = new Float32Array(this.buffer.length + e.data.pcm.length);
-        next.set(this.buffer);
-        next.set(e.data.pcm, this.buffer.length);
-        this.buffer = next;
+        this.write(e.data.pcm);
       } else if (e.data.clear) {
-        this.buffer = new Float32Array(0);
+        this.readIndex = 0;
+        this.available = 0;
       }
     };
   }
 
+  write(pcm) {
+    if (this.available + pcm.length > this.buffer.length) {
+      this.grow(this.available + pcm.length);
+    }
+    const capacity = this.buffer.length;
+    const writeIndex = (this.readIndex + this.available) % capacity;
+    const first = Math.min(pcm.length, capacity - writeIndex);
+    this.buffer.set(pcm.subarray(0, first), writeIndex);
+    this.buffer.set(pcm.subarray(first), 0);
+    this.available += pcm.length;
+  }
+
+  read(target, count) {
+    const capacity = this.buffer.length;
+    const first = Math.min(count, capacity - this.readIndex);
+    target.set(this.buffer.subarray(this.readIndex, this.readIndex + first));
+    target.set(this.buffer.subarray(0, count - first), first);
+    this.readIndex = (this.readIndex + count) % capacity;
+    this.available -= count;
+  }
+
+  grow(minCapacity) {
+    let capacity = this.buffer.length * 2;
+    while (capacity < minCapacity) capacity *= 2;
+    const next = new Float32Array(capacity);
+    const available = this.available;
+    this.read(next, available);
+    this.buffer = next;
+    this.readIndex = 0;
+    this.available = available;
+  }
+
   process(_, outputs) {
     const out = outputs[0][0];
-    if (this.buffer.length >= out.length) {
-      out.set(this.buffer.subarray(0, out.length));
-      this.buffer = this.buffer.subarray(out.length);
-    } else {
-      out.fill(0);
-      this.buffer = new Float32Array(0);
-    }
+    const count = Math.min(out.length, this.available);
+    this.read(out, count);
+    out.fill(0, count);
     return true;
   }
 }